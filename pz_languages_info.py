@@ -1,5 +1,30 @@
 import os
+import sys
 import json
+import time
+import functools
+
+ScriptDir = os.path.dirname(os.path.abspath(__file__))
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def readJson(path):
+    if orjson:
+        with open(path,"rb") as f:
+            return orjson.loads(f.read())
+    with open(path,"r",encoding="utf-8") as f:
+        return json.load(f)
+
+def writeJson(path,data):
+    if orjson:
+        with open(path,"wb") as f:
+            f.write(orjson.dumps(data,option=orjson.OPT_INDENT_2))
+    else:
+        with open(path,"w",encoding="utf-8") as f:
+            json.dump(data,f,indent=2)
 
 Aliases = {
     'AR': ['spanish'], #ar
@@ -31,19 +56,37 @@ Aliases = {
     'UA': ['ukrainian'],
 }
 
-def getTranslateDir():
+# option names are stored lower-cased, as ConfigParser does
+@functools.lru_cache(maxsize=8)
+def _loadConfig(path,mtime):
     from configparser import ConfigParser
     config = ConfigParser()
-    config.read("config.ini")
-    return config["Directories"]["PZTranslateDir"]
+    with open(path,"r",encoding="utf-8") as f:
+        config.read_string(f.read())
+    return {section: dict(config[section]) for section in config}
 
+def loadConfig(path):
+    return _loadConfig(str(path), os.path.getmtime(path))
+
+def getTranslateDir():
+    config = loadConfig("config.ini")
+    return config["Directories"]["pztranslatedir"]
+
+@functools.lru_cache(maxsize=None)
 def getTranslateCodes(name):
+    cachePath = os.path.join(ScriptDir, "SupportedLanguages." + name + ".json")
+    if os.path.isfile(cachePath) and time.time() - os.path.getmtime(cachePath) < 30 * 86400:
+        return readJson(cachePath)
     if name == "google":
         from deep_translator import GoogleTranslator
-        return GoogleTranslator().get_supported_languages(True)
+        codes = GoogleTranslator().get_supported_languages(True)
     elif name == "googletrans":
         from googletrans.constants import LANGCODES
-        return LANGCODES
+        codes = LANGCODES
+    else:
+        return None
+    writeJson(cachePath,codes)
+    return codes
 
 # uses scriptblock - need improvement
 def readLanguageFile(filePath: str):
@@ -73,7 +116,7 @@ def generateLanguagesInfo():
     with os.scandir(translateDir) as tDir:
         for each in tDir:
             if each.is_dir():
-                d = readLanguageFile(os.path.join(translateDir,each.name,"language.txt"))
+                d = readLanguageFile(os.path.join(each.path,"language.txt"))
                 if not d:
                     continue
                 d["id"] = each.name
@@ -87,12 +130,15 @@ def generateLanguagesInfo():
     return all
 
 def getLanguages(generate: bool = False):
-    LanguagesPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "LanguagesInfo.json")
+    LanguagesPath = os.path.join(ScriptDir, "LanguagesInfo.json")
     if generate or not os.path.isfile(LanguagesPath):
         d = generateLanguagesInfo()
-        with open(LanguagesPath,"w",encoding="utf-8") as f:
-            json.dump(d,f,indent=2)
+        writeJson(LanguagesPath,d)
         return d
     else:
-        with open(LanguagesPath,"r",encoding="utf-8") as f:
-            return json.load(f)
+        all = readJson(LanguagesPath)
+        # keys repeat across the many per-language dicts held at once
+        for lang in all.values():
+            lang["id"] = sys.intern(lang["id"])
+            lang["charset"] = sys.intern(lang["charset"])
+        return all
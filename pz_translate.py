@@ -1,172 +1,304 @@
 import os
 import pathlib
+import re
+import sys
+import codecs
+import time
+import types
+import shelve
+import hashlib
+import threading
 from shutil import copyfile
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from deep_translator import GoogleTranslator
-from pz_languages_info import getLanguages
+from pz_languages_info import getLanguages, loadConfig, readJson, writeJson
 
-LanguagesDict = getLanguages(False)
+# deep_translator issues every request through module-level requests.get, opening a fresh
+# TCP/TLS connection each call. A pooled Session has the same interface, so swapping it in
+# keeps one connection alive for the thousands of calls per run.
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    TrSession = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=32,pool_maxsize=32)
+    TrSession.mount("https://",_adapter)
+    TrSession.mount("http://",_adapter)
+    for _name,_mod in list(sys.modules.items()):
+        if _name.startswith("deep_translator") and getattr(_mod,"requests",None) is requests:
+            _mod.requests = TrSession
+except Exception:
+    TrSession = None
+
+ScriptDir = os.path.dirname(os.path.abspath(__file__))
+
+# read-only views so the language dicts can be shared freely across pool threads
+@functools.lru_cache(maxsize=None)
+def getLanguagesDict():
+    return {k: types.MappingProxyType(v) for k,v in getLanguages(False).items()}
+
+@functools.lru_cache(maxsize=None)
+def getCodec(charset:str):
+    return codecs.lookup(charset)
 
 FileList = [ "Challenge", "ContextMenu", "DynamicRadio", "EvolvedRecipeName", "Farming", "GameSound", 
             "IG_UI", "ItemName", "Items", "MakeUp", "Moodles", "Moveables", "MultiStageBuild", "Recipes", 
             "Recorded_Media", "Sandbox", "Stash", "SurvivalGuide", "Tooltip", "UI"]
+FileSet = frozenset(FileList)
+
+# key part, prefix up to the first quote after "=", text up to the last quote, rest of the line
+EntryRe = re.compile('([^=]*)=([^"]*")(.*)("[^"]*)')
+
+VarsModMap = {"<":"<{", ">":"}>", "%1":"{%1}"}
+VarsModRe = re.compile("<|>|%1")
+VarsDemodMap = {"{%1}":"%1", "<{":"<", "}>":">"}
+VarsDemodRe = re.compile(r"\{%1\}|<\{|\}>")
+
+class TokenBucket:
+    '''
+    simple thread-safe token bucket, sleeps until budget is available instead of
+    letting the server reject and retry
+    '''
+
+    def __init__(self,perMinute:int):
+        self.capacity = perMinute
+        self.tokens = perMinute
+        self.rate = perMinute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self,amount:int=1):
+        amount = min(amount,self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            time.sleep(wait)
 
 def varsMod(text:str):
-    return text.replace("<","<{").replace(">","}>").replace("%1","{%1}")
+    return VarsModRe.sub(lambda m: VarsModMap[m.group()], text)
 
 def varsDemod(text:str):
-    return text.replace("{%1}","%1").replace("<{","<").replace("}>",">")
+    return VarsDemodRe.sub(lambda m: VarsDemodMap[m.group()], text)
 
 class pz_translator_zx:
     
     def __init__(self,baseDir:str="",source:str="EN",hasConfig:bool=True,gitAtr:bool=False):
         self.baseDir = baseDir
+        self.langDirs = {}
+        self.workers = 16
+        self.requestBucket = None
+        self.charBucket = None
+        self.translators = {}
         if hasConfig:
-            self.fromConfig(os.path.join(os.path.dirname(__file__),"config.ini"))
+            self.fromConfig(os.path.join(ScriptDir,"config.ini"))
         else:
-            self.sourceLang = LanguagesDict[source]
-        self.translator = GoogleTranslator(self.sourceLang["tr_code"])
+            self.sourceLang = getLanguagesDict()[source]
+        # dumb-dbm shelves have no locking, so concurrent writers corrupt the db;
+        # translate_project workers open it read-only and stage new entries in an
+        # overlay that the parent merges once the pool is done
+        self.cacheOverlay = {} if "PZ_TRANSLATE_THROTTLE_SCALE" in os.environ else None
+        try:
+            if self.cacheOverlay is None:
+                self.trCache = shelve.open(os.path.join(ScriptDir,"tr_cache"))
+            else:
+                self.trCache = shelve.open(os.path.join(ScriptDir,"tr_cache"),flag="r")
+        except Exception:
+            # missing or unreadable db, run without the persistent cache
+            self.trCache = {}
+        self.cacheLock = threading.Lock()
         if gitAtr:
             self.checkGitAtributesFile()
 
     def fromConfig(self,file):
-        from configparser import ConfigParser
-        config = ConfigParser()
-        config.read(file)
+        config = loadConfig(file)
         source = config["Translate"]["source"]
 
         assert os.path.isdir(os.path.join(self.baseDir,source)), "Missing source directory, wrong path?\nDir: " + os.path.join(self.baseDir,source)
 
-        self.baseDir = self.baseDir if self.baseDir else config["Directories"][config["Translate"]["target"]]
-        self.sourceLang = LanguagesDict[source]
+        languagesDict = getLanguagesDict()
+        self.baseDir = self.baseDir if self.baseDir else config["Directories"][config["Translate"]["target"].lower()]
+        self.sourceLang = languagesDict[source]
+        if "workers" in config["Translate"]:
+            self.workers = int(config["Translate"]["workers"])
+        if "Throttle" in config:
+            # translate_project sets this so the budget is shared across its worker processes
+            scale = int(os.environ.get("PZ_TRANSLATE_THROTTLE_SCALE","1"))
+            if "requestsperminute" in config["Throttle"]:
+                self.requestBucket = TokenBucket(max(1,int(config["Throttle"]["requestsperminute"]) // scale))
+            if "charsperminute" in config["Throttle"]:
+                self.charBucket = TokenBucket(max(1,int(config["Throttle"]["charsperminute"]) // scale))
         if "files" in config["Translate"]:
-            self.files = [x for x in [x.strip() for x in config["Translate"]["files"].split(",")] if x in FileList]
+            self.files = [x for x in [x.strip() for x in config["Translate"]["files"].split(",")] if x in FileSet]
         else:
             self.files = FileList
-        if "languagesExclude" in config["Translate"]:
-            languagesExclude = {x for x in [x.strip() for x in config["Translate"]["languagesExclude"].split(",")] if x in LanguagesDict}
+        if "languagesexclude" in config["Translate"]:
+            languagesExclude = {x for x in [x.strip() for x in config["Translate"]["languagesexclude"].split(",")] if x in languagesDict}
         else:
             languagesExclude = set()
         languagesExclude.add(source)
-        if "languagesTranslate" in config["Translate"]:
-            languagesTranslate = [x for x in [x.strip() for x in config["Translate"]["languagesTranslate"].split(",")] if x not in languagesExclude and x in LanguagesDict]
+        if "languagestranslate" in config["Translate"]:
+            languagesTranslate = [x for x in [x.strip() for x in config["Translate"]["languagestranslate"].split(",")] if x not in languagesExclude and x in languagesDict]
         else:
-            languagesTranslate = [x for x in LanguagesDict if x not in languagesExclude]
-        if "languagesCreate" in config["Translate"]:
-            languagesCreate = {x for x in [x.strip() for x in config["Translate"]["languagesCreate"].split(",")] if x in languagesTranslate}
+            languagesTranslate = [x for x in languagesDict if x not in languagesExclude]
+        if "languagescreate" in config["Translate"]:
+            languagesTranslateSet = set(languagesTranslate)
+            languagesCreate = {x for x in [x.strip() for x in config["Translate"]["languagescreate"].split(",")] if x in languagesTranslateSet}
         else:
             languagesCreate = languagesTranslate
         self.translateLanguages = self.getLanguagesForTranslate(languagesTranslate,languagesCreate)
 
     def getFilePath(self,langId: str, file: str = None):
+        langDir = self.langDirs.get(langId)
+        if langDir is None:
+            langDir = self.langDirs[langId] = os.path.join(self.baseDir, langId)
         if not file:
-            return os.path.join(self.baseDir, langId)
+            return langDir
         else:
-            return os.path.join(self.baseDir, langId, file + "_" + langId + ".txt")
+            return os.path.join(langDir, file + "_" + langId + ".txt")
         
     def getLanguagesForTranslate(self,translate:list|dict,create:set):
         translateLanguages = []
+        languagesDict = getLanguagesDict()
+        existingDirs = {entry.name for entry in os.scandir(self.baseDir) if entry.is_dir()}
         for id in translate:
-            if os.path.isdir(os.path.join(self.baseDir,id)):
-                translateLanguages.append(LanguagesDict[id])
+            if id in existingDirs:
+                translateLanguages.append(languagesDict[id])
             elif id in create:
                 pathlib.Path(self.getFilePath(id)).mkdir()
-                translateLanguages.append(LanguagesDict[id])
+                translateLanguages.append(languagesDict[id])
         return translateLanguages
 
     def readSourceFile(self,file:str):
         try:
-            with open(self.getFilePath(self.sourceLang["id"],file),'r',encoding=self.sourceLang["charset"]) as f:
-                lines = []
-                tDict = {}
-                validLine = False
-                key = ""
-                text = ""
-                
-                lines += f.readline().replace("{","{{").replace(self.sourceLang["id"],"{language}")
-
-                for line in f:
-                    line = line.replace("{","{{")
-                    line = line.replace("}","}}")
-                    if "=" in line and "\"" in line:
-                        index1 = line.index("=")
-                        index2 = line.index("\"",index1+1)
-                        index3 = line.rindex("\"")
-                        key = line[:index1].strip().replace(".","-")
-                        text = line[index2+1:index3]
-                        lines += line[:index2+1], "{", key, "}", line[index3:]
-                        tDict[key] = text
-                        validLine = True
-                    elif "--" in line or not line.strip() or line.strip().endswith("..") and not validLine:
-                        validLine = False
-                        lines += line
-                    else:
-                        validLine = True
-                        lines += line
-
-                    if not validLine or not line.strip().endswith(".."):
-                        validLine = False
-                        key = ""
-                        text = ""
-
-                return "".join(lines), tDict
+            with open(self.getFilePath(self.sourceLang["id"],file),"rb") as f:
+                data = getCodec(self.sourceLang["charset"]).decode(f.read())[0]
         except FileNotFoundError:
             return None, None
 
-    def fillTranslationsFromFile(self,lang:dict,file:str,trTexts:dict):
-        try:
-            with open(self.getFilePath(lang["id"],file),'r',encoding=lang["charset"],errors="replace") as f:
+        segments = []
+        literal = []
+        tDict = {}
+        validLine = False
+        key = ""
+        text = ""
+
+        header, sep, rest = data.partition("\n")
+        parts = (header + sep).split(self.sourceLang["id"])
+        literal.append(parts[0])
+        for part in parts[1:]:
+            segments.append(("".join(literal),"language"))
+            literal = [part]
+
+        for line in rest.splitlines(keepends=True):
+            m = EntryRe.match(line)
+            if m:
+                key = sys.intern(m.group(1).strip().replace(".","-"))
+                text = m.group(3)
+                literal.extend((m.group(1), "=", m.group(2)))
+                segments.append(("".join(literal),key))
+                literal = [m.group(4)]
+                tDict[key] = text
+                validLine = True
+            elif "--" in line or not line.strip() or line.strip().endswith("..") and not validLine:
+                validLine = False
+                literal.append(line)
+            else:
+                validLine = True
+                literal.append(line)
+
+            if not validLine or not line.strip().endswith(".."):
                 validLine = False
                 key = ""
                 text = ""
-                
-                f.readline()
-
-                for line in f:
-                    if "=" in line and "\"" in line:
-                        index1 = line.index("=")
-                        index2 = line.index("\"",index1+1)
-                        index3 = line.rindex("\"")
-                        key = line[:index1].strip().replace(".","-")
-                        text = line[index2+1:index3]
-                        trTexts[key] = text
-                        validLine = True
-                    elif "--" in line or not line.strip() or line.strip().endswith("..") and not validLine:
-                        validLine = False
-                    else:
-                        validLine = True
-
-                    if not validLine or not line.strip().endswith(".."):
-                        validLine = False
-                        key = ""
-                        text = ""
+
+        if literal:
+            segments.append(("".join(literal),None))
+        return segments, tDict
+
+    def fillTranslationsFromFile(self,lang:dict,file:str,trTexts:dict):
+        try:
+            with open(self.getFilePath(lang["id"],file),"rb") as f:
+                data = getCodec(lang["charset"]).decode(f.read(),"replace")[0]
         except:
-            pass
+            return
+
+        for line in data.splitlines()[1:]:
+            m = EntryRe.match(line)
+            if m:
+                trTexts[sys.intern(m.group(1).strip().replace(".","-"))] = m.group(3)
     
-    def translate_single(self,tLang,oTexts: dict, tTexts:dict):
-        untranslated = len(oTexts) + 1 - len(tTexts)
-        if untranslated > 0:
-            print(" - Untranslated texts size: ",untranslated)
-        for key, value in oTexts.items():
-            if key not in tTexts:
-                try:
-                    tTexts[key] = varsDemod(self.translator.translate(varsMod(value)))
-                except:
-                    print(" - Failed to translate: " + tTexts["language"] + " | " + value)
-                    tTexts[key] = "tr?: " + value
-
-    def translate_batch(self,tLang,oTexts,tTexts):
+    def getTranslator(self,trCode:str):
+        translator = self.translators.get(trCode)
+        if translator is None:
+            translator = self.translators[trCode] = GoogleTranslator(self.sourceLang["tr_code"],trCode)
+        return translator
+
+    def cacheKey(self,tLang,value:str):
+        return self.sourceLang["id"] + "|" + tLang["id"] + "|" + hashlib.blake2b(value.encode("utf-8"),digest_size=16).hexdigest()
+
+    def fromCache(self,tLang,value:str):
+        key = self.cacheKey(tLang,value)
+        with self.cacheLock:
+            if self.cacheOverlay is not None and key in self.cacheOverlay:
+                return self.cacheOverlay[key]
+            try:
+                return self.trCache.get(key)
+            except Exception:
+                # a corrupt record should not kill the language job
+                return None
+
+    def toCache(self,tLang,value:str,translation:str):
+        with self.cacheLock:
+            if self.cacheOverlay is not None:
+                self.cacheOverlay[self.cacheKey(tLang,value)] = translation
+            else:
+                self.trCache[self.cacheKey(tLang,value)] = translation
+
+    def throttle(self,values:list):
+        if self.requestBucket:
+            self.requestBucket.acquire()
+        if self.charBucket:
+            self.charBucket.acquire(sum(len(x) for x in values))
+
+    def translate_single(self,translator,tLang,oTexts: dict, tTexts:dict,missing=None):
+        if missing is None:
+            missing = oTexts.keys() - tTexts.keys()
+        for key in missing:
+            value = oTexts[key]
+            try:
+                self.throttle((value,))
+                tTexts[key] = varsDemod(translator.translate(varsMod(value)))
+            except:
+                print(" - Failed to translate: " + tTexts["language"] + " | " + value)
+                tTexts[key] = "tr?: " + value
+
+    def translate_batch(self,translator,tLang,oTexts,tTexts,missing=None):
+        if missing is None:
+            missing = oTexts.keys() - tTexts.keys()
         keys, values = [],[]
-        for key in oTexts:
-            if key not in tTexts:
+        for key in missing:
+            cached = self.fromCache(tLang,oTexts[key])
+            if cached is not None:
+                tTexts[key] = cached
+            else:
                 keys.append(key)
                 values.append(varsMod(oTexts[key]))
         if keys:
             try:
                 print(" - Untranslated texts size: ",len(values))
-                translations = self.translator.translate_batch(values)
+                translations = []
+                for i in range(0,len(values),100):
+                    self.throttle(values[i:i+100])
+                    translations += translator.translate_batch(values[i:i+100])
                 for i,key in enumerate(keys):
                     tTexts[key] = varsDemod(translations[i])
+                    self.toCache(tLang,oTexts[key],tTexts[key])
                     try:
                         tTexts[key].encode(tLang["charset"])
                     except:
@@ -176,52 +308,151 @@ class pz_translator_zx:
                     print(" - Failed to translate: " + tTexts["language"] + " | " + values[i])
                     tTexts[k] = "tr?: " + values[i]
 
-    def getTranslations(self,oTexts: dict, tLang: dict, file: str):
+    def getTranslations(self,translator,oTexts: dict, tLang: dict, file: str,changed:set=frozenset()):
         trTexts = {"language":tLang["id"]}
         self.fillTranslationsFromFile(tLang,file,trTexts)
-        self.translate_batch(tLang,oTexts,trTexts)
+        for key in changed:
+            trTexts.pop(key,None)
+        missing = oTexts.keys() - trTexts.keys()
+        if not missing:
+            return trTexts
+        self.translate_batch(translator,tLang,oTexts,trTexts,missing)
         return trTexts
 
     def writeTranslation(self,lang: dict, file: str, text: str):
         try:
-            with open(self.getFilePath(lang["id"],file),"w",encoding=lang["charset"],errors="replace") as f:
-                f.write(text)
+            with open(self.getFilePath(lang["id"],file),"wb") as f:
+                f.write(getCodec(lang["charset"]).encode(text,"replace")[0])
         except Exception as e:
             print("Failed to write " + lang["id"] + " " + file)
             print(e)
             print(text)
 
+    def renderTranslation(self,segments,tTexts:dict):
+        return "".join(chunk if key is None else chunk + tTexts[key] for chunk,key in segments)
+
+    def translateLanguage(self,lang,sources:dict,changedByFile:dict):
+        print("Begin Translation Check for: {id}, {lang} ".format(id=lang["id"],lang=lang["text"]))
+        trTextsByFile = {}
+        # one directory scan replaces a stat per file below
+        try:
+            existingFiles = {entry.name for entry in os.scandir(self.getFilePath(lang["id"]))}
+        except FileNotFoundError:
+            existingFiles = set()
+        # source text -> translation, seeded from the files already on disk for this language
+        textCache = {}
+        for file,(segments,oTexts) in sources.items():
+            trTexts = {"language":lang["id"]}
+            if file + "_" + lang["id"] + ".txt" in existingFiles:
+                self.fillTranslationsFromFile(lang,file,trTexts)
+            for key in changedByFile.get(file,()):
+                trTexts.pop(key,None)
+            trTextsByFile[file] = trTexts
+            for key,translation in trTexts.items():
+                value = oTexts.get(key)
+                if value is not None:
+                    textCache[value] = translation
+        pairs, values, valueIndex = [], [], {}
+        for file,(segments,oTexts) in sources.items():
+            trTexts = trTextsByFile[file]
+            for key in oTexts.keys() - trTexts.keys():
+                value = oTexts[key]
+                cached = textCache.get(value)
+                if cached is None:
+                    cached = self.fromCache(lang,value)
+                if cached is not None:
+                    trTexts[key] = cached
+                else:
+                    index = valueIndex.get(value)
+                    if index is None:
+                        index = valueIndex[value] = len(values)
+                        values.append(varsMod(value))
+                    pairs.append((file,key,index))
+        if pairs:
+            print(" - Untranslated texts size: ",len(values)," ",lang["id"])
+            translator = self.getTranslator(lang["tr_code"])
+            try:
+                translations = []
+                for i in range(0,len(values),100):
+                    self.throttle(values[i:i+100])
+                    translations += translator.translate_batch(values[i:i+100])
+                translations = [varsDemod(x) for x in translations]
+                for value,index in valueIndex.items():
+                    self.toCache(lang,value,translations[index])
+                for file,key,index in pairs:
+                    translation = translations[index]
+                    trTextsByFile[file][key] = translation
+                    try:
+                        translation.encode(lang["charset"])
+                    except:
+                        print(" - can not encode: ",key,translation)
+            except:
+                for file,key,index in pairs:
+                    print(" - Failed to translate: " + lang["id"] + " | " + values[index])
+                    trTextsByFile[file][key] = "tr?: " + values[index]
+        for file,(segments,oTexts) in sources.items():
+            self.writePool.submit(self.writeTranslation,lang,file,self.renderTranslation(segments,trTextsByFile[file]))
+
+    def loadSourceHashes(self):
+        try:
+            return readJson(os.path.join(self.baseDir,".translation_hashes.json"))
+        except (FileNotFoundError,ValueError):
+            return {}
+
     def translate_self(self):
+        sourceHashes = self.loadSourceHashes()
+        sources = {}
+        changedByFile = {}
         for file in self.files:
-            templateText, oTexts = self.readSourceFile(file)
+            segments, oTexts = self.readSourceFile(file)
             if not oTexts:
                 continue
-            for lang in self.translateLanguages:
-                print("Begin Translation Check for: {file}, {id}, {lang} ".format(file=file,id=lang["id"],lang=lang["text"]))
-                self.translator.target = lang["tr_code"]
-                self.writeTranslation(lang,file,templateText.format_map(self.getTranslations(oTexts,lang,file)))
+            fileHashes = {key: hashlib.blake2b(value.encode("utf-8"),digest_size=8).hexdigest() for key,value in oTexts.items()}
+            oldHashes = sourceHashes.get(file,{})
+            changedByFile[file] = {key for key,h in fileHashes.items() if key in oldHashes and oldHashes[key] != h}
+            sourceHashes[file] = fileHashes
+            sources[file] = (segments,oTexts)
+        if not sources:
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as pool, ThreadPoolExecutor(max_workers=8) as writePool:
+            self.writePool = writePool
+            futures = [pool.submit(self.translateLanguage,lang,sources,changedByFile) for lang in self.translateLanguages]
+            for future in as_completed(futures):
+                future.result()
+        writeJson(os.path.join(self.baseDir,".translation_hashes.json"),sourceHashes)
+        if self.cacheOverlay is None and hasattr(self.trCache,"sync"):
+            with self.cacheLock:
+                self.trCache.sync()
 
     def translate(self,languages:list|dict,files:list,languagesCreate:set[str]|None=set()):
         self.files = files
         self.translateLanguages = self.getLanguagesForTranslate(languages,languagesCreate)
         self.translate_self()
 
-    def convertTranslations(self,readEncodes:dict,languages:list=LanguagesDict,files:list=FileList):
+    def convertTranslations(self,readEncodes:dict,languages:list=None,files:list=FileList):
         '''
         attempt to convert to appropriate encoding
         '''
+        languagesDict = getLanguagesDict()
+        if languages is None:
+            languages = languagesDict
         for id in languages:
-            lang = LanguagesDict[id]
+            lang = languagesDict[id]
+            readCodec = getCodec(readEncodes[id])
+            writeCodec = getCodec(lang["charset"])
+            try:
+                existingFiles = {entry.name for entry in os.scandir(self.getFilePath(id))}
+            except FileNotFoundError:
+                continue
             for file in files:
                 oFile = self.getFilePath(id,file)
-                if os.path.isfile(oFile):
-                    f = open(oFile,"r", encoding=readEncodes[id],errors="replace")
-                    text = f.read()
-                    f.close()
-
-                    f = open(oFile,"w", encoding=lang["charset"],errors="replace")
-                    f.write(text)
-                    f.close()
+                if file + "_" + id + ".txt" in existingFiles:
+                    with open(oFile,"rb") as f:
+                        data = f.read()
+                    converted = writeCodec.encode(readCodec.decode(data,"replace")[0],"replace")[0]
+                    if converted != data:
+                        with open(oFile,"wb") as f:
+                            f.write(converted)
 
     def reencode_self(self):
         '''
@@ -235,11 +466,16 @@ class pz_translator_zx:
     def checkGitAtributesFile(self):
         fPath = os.path.join(self.baseDir,".gitattributes")
         if not os.path.exists(fPath):
-            copyfile(os.path.join(os.path.dirname(__file__), ".gitattributes-template.txt"),fPath,follow_symlinks=False)
+            copyfile(os.path.join(ScriptDir, ".gitattributes-template.txt"),fPath,follow_symlinks=False)
+
+def translateModDir(modpath:str):
+    o = pz_translator_zx(modpath,gitAtr=True)
+    o.translate_self()
+    return o.cacheOverlay
 
 def translate_project(dir,args):
-    with open(os.path.join(dir,"project.json"),"r",encoding="utf-8") as f:
-        project = json.load(f)
+    project = readJson(os.path.join(dir,"project.json"))
+    modpaths = []
     for id in project["mods"]:
         if id in project["workshop"]["excludes"]:
             continue
@@ -247,8 +483,24 @@ def translate_project(dir,args):
         if not modpath.is_dir():
             print("Invalid translation dir:",modpath.resolve())
             continue
-        o = pz_translator_zx(modpath.resolve(),gitAtr=True)
-        o.translate_self()
+        modpaths.append(str(modpath.resolve()))
+    if not modpaths:
+        return
+    # mods are independent directories, translate them in parallel processes;
+    # each worker builds its own TokenBuckets, so split the [Throttle] budget
+    # across the pool (the env var is inherited by the child processes)
+    poolSize = min(len(modpaths),os.cpu_count() or 1)
+    os.environ["PZ_TRANSLATE_THROTTLE_SCALE"] = str(poolSize)
+    with ProcessPoolExecutor(max_workers=poolSize) as pool:
+        overlays = [x for x in pool.map(translateModDir,modpaths) if x]
+    # workers cannot write the shared cache themselves, merge their entries here
+    if overlays:
+        try:
+            with shelve.open(os.path.join(ScriptDir,"tr_cache")) as db:
+                for overlay in overlays:
+                    db.update(overlay)
+        except Exception:
+            pass
 
 def translate_mod(dir,args):
     modpath = pathlib.Path(dir,"media","lua","shared","Translate")